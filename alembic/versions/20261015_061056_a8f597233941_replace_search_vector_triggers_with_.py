@@ -0,0 +1,84 @@
+"""replace search vector triggers with generated columns
+
+Revision ID: a8f597233941
+Revises: bf22d91ea9e2
+Create Date: 2026-10-15 06:10:56.522634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8f597233941'
+down_revision: Union[str, Sequence[str], None] = 'bf22d91ea9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCHABLE_TABLES = ('schemas', 'tables', 'columns')
+
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Drop the per-row triggers and their plpgsql function
+    for table in SEARCHABLE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS update_search_vector();")
+
+    # Replace each search_vector with a generated column (drops its GIN index too)
+    for table in SEARCHABLE_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table}
+                DROP COLUMN search_vector,
+                ADD COLUMN search_vector tsvector
+                    GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED;
+        """)
+
+    # Recreate GIN indexes for fast full-text search
+    op.create_index('idx_schemas_search', 'schemas', ['search_vector'], postgresql_using='gin')
+    op.create_index('idx_tables_search', 'tables', ['search_vector'], postgresql_using='gin')
+    op.create_index('idx_columns_search', 'columns', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Turn the generated columns back into plain tsvector columns
+    for table in SEARCHABLE_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table}
+                DROP COLUMN search_vector,
+                ADD COLUMN search_vector tsvector;
+        """)
+
+    op.create_index('idx_schemas_search', 'schemas', ['search_vector'], postgresql_using='gin')
+    op.create_index('idx_tables_search', 'tables', ['search_vector'], postgresql_using='gin')
+    op.create_index('idx_columns_search', 'columns', ['search_vector'], postgresql_using='gin')
+
+    # Restore the trigger function and triggers
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_search_vector()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table in SEARCHABLE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_search_vector_update
+                BEFORE INSERT OR UPDATE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION update_search_vector();
+        """)
+        op.execute(f"UPDATE {table} SET search_vector = {SEARCH_VECTOR_EXPRESSION};")
@@ -0,0 +1,206 @@
+"""count search_catalog matches without ranking
+
+Revision ID: 1ec46c1b8a27
+Revises: 795c72df3dc8
+Create Date: 2026-10-15 06:14:03.798532
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ec46c1b8a27'
+down_revision: Union[str, Sequence[str], None] = '795c72df3dc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last row they received as the after_* cursor to fetch the next page.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        result_type TEXT,
+        entity_id INTEGER,
+        name TEXT,
+        description TEXT,
+        name_highlight TEXT,
+        description_highlight TEXT,
+        rank REAL,
+        schema_id INTEGER,
+        schema_name TEXT,
+        table_id INTEGER,
+        table_name TEXT,
+        column_id INTEGER,
+        column_name TEXT,
+        owner_id INTEGER,
+        owner_name TEXT,
+        total_count BIGINT
+    ) AS $$
+    DECLARE
+        query tsquery := websearch_to_tsquery('english', search_terms);
+    BEGIN
+        RETURN QUERY
+        WITH
+        -- Thin per-entity matches: only ids, sort keys and rank
+        sch_matches AS (
+            SELECT 'schema'::text AS kind, s.id, s.name::text AS name,
+                ts_rank_cd(s.search_vector, query) AS r, FALSE AS is_parent
+            FROM schemas s
+            WHERE s.search_vector @@ query
+              AND filter_owner_id IS NULL  -- schemas have no owner
+              AND (filter_schema_id IS NULL OR s.id = filter_schema_id)
+        ),
+
+        tbl_matches AS (
+            SELECT 'table'::text AS kind, t.id, t.name::text AS name,
+                ts_rank_cd(t.search_vector, query) AS r, FALSE AS is_parent
+            FROM tables t
+            WHERE t.search_vector @@ query
+              AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)
+        ),
+
+        col_matches AS (
+            SELECT 'column'::text AS kind, c.id, c.name::text AS name,
+                ts_rank_cd(c.search_vector, query) AS r, FALSE AS is_parent
+            FROM columns c
+            JOIN tables t ON c.table_id = t.id
+            WHERE c.search_vector @@ query
+              AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, t.id, t.name::text AS name,
+                (MAX(ts_rank_cd(c.search_vector, query)) * 0.9)::real AS r,  -- Slightly lower rank than direct match
+                TRUE AS is_parent
+            FROM columns c
+            JOIN tables t ON c.table_id = t.id
+            WHERE include_parent_tables
+              AND c.search_vector @@ query
+              AND NOT t.search_vector @@ query
+              AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)
+            GROUP BY t.id, t.name
+        ),
+
+        -- Each branch only needs its own next page_size rows after the cursor
+        hits AS (
+            (SELECT m.* FROM sch_matches m
+             WHERE after_rank IS NULL OR m.r < after_rank
+                OR (m.r = after_rank AND (m.kind, m.name, m.id) > (after_type, after_name, after_id))
+             ORDER BY m.r DESC, m.name, m.id LIMIT page_size)
+            UNION ALL
+            (SELECT m.* FROM tbl_matches m
+             WHERE after_rank IS NULL OR m.r < after_rank
+                OR (m.r = after_rank AND (m.kind, m.name, m.id) > (after_type, after_name, after_id))
+             ORDER BY m.r DESC, m.name, m.id LIMIT page_size)
+            UNION ALL
+            (SELECT m.* FROM par_matches m
+             WHERE after_rank IS NULL OR m.r < after_rank
+                OR (m.r = after_rank AND (m.kind, m.name, m.id) > (after_type, after_name, after_id))
+             ORDER BY m.r DESC, m.name, m.id LIMIT page_size)
+            UNION ALL
+            (SELECT m.* FROM col_matches m
+             WHERE after_rank IS NULL OR m.r < after_rank
+                OR (m.r = after_rank AND (m.kind, m.name, m.id) > (after_type, after_name, after_id))
+             ORDER BY m.r DESC, m.name, m.id LIMIT page_size)
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM hits h
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Count matches straight off the GIN predicates, without ranking
+        total AS (
+            SELECT
+                (SELECT count(*) FROM schemas s
+                 WHERE s.search_vector @@ query
+                   AND filter_owner_id IS NULL
+                   AND (filter_schema_id IS NULL OR s.id = filter_schema_id)) +
+                (SELECT count(*) FROM tables t
+                 WHERE t.search_vector @@ query
+                   AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+                   AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)) +
+                (SELECT count(*) FROM columns c JOIN tables t ON c.table_id = t.id
+                 WHERE c.search_vector @@ query
+                   AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+                   AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)) +
+                (SELECT count(DISTINCT t.id) FROM columns c JOIN tables t ON c.table_id = t.id
+                 WHERE include_parent_tables
+                   AND c.search_vector @@ query
+                   AND NOT t.search_vector @@ query
+                   AND (filter_owner_id IS NULL OR t.owner_id = filter_owner_id)
+                   AND (filter_schema_id IS NULL OR t.schema_id = filter_schema_id)) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT
+            p.kind AS result_type,
+            p.id AS entity_id,
+            p.name,
+            d.description,
+            CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                 ELSE ts_headline('english', p.name, query,
+                    'StartSel=<mark>, StopSel=</mark>')
+            END AS name_highlight,
+            CASE WHEN p.is_parent THEN COALESCE(d.description, '')
+                 ELSE ts_headline('english', COALESCE(d.description, ''), query,
+                    'StartSel=<mark>, StopSel=</mark>, MaxFragments=3, MaxWords=50')
+            END AS description_highlight,
+            p.r AS rank,
+            s.id AS schema_id,
+            s.name::text AS schema_name,
+            t.id AS table_id,
+            t.name::text AS table_name,
+            c.id AS column_id,
+            c.name::text AS column_name,
+            t.owner_id AS owner_id,
+            o.name::text AS owner_name,
+            tot.total_count
+        FROM page p
+        CROSS JOIN total tot
+        LEFT JOIN columns c ON p.kind = 'column' AND c.id = p.id
+        LEFT JOIN tables t ON t.id = CASE p.kind WHEN 'table' THEN p.id ELSE c.table_id END
+        JOIN schemas s ON s.id = CASE p.kind WHEN 'schema' THEN p.id ELSE t.schema_id END
+        LEFT JOIN owners o ON t.owner_id = o.id
+        CROSS JOIN LATERAL (
+            SELECT CASE p.kind
+                WHEN 'schema' THEN s.description
+                WHEN 'table' THEN t.description
+                ELSE c.description
+            END AS description
+        ) d
+        ORDER BY p.r DESC, p.kind, p.name, p.id;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Compute total_count with rank-free count(*) queries."""
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Restore the previous version of the search function."""
+    previous = context.script.get_revision(down_revision).module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
@@ -0,0 +1,238 @@
+"""add catalog search materialized view
+
+Revision ID: ebf28b87c7e3
+Revises: 49c3b5a00315
+Create Date: 2026-10-15 06:15:17.520816
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ebf28b87c7e3'
+down_revision: Union[str, Sequence[str], None] = '49c3b5a00315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose writes invalidate the view (owners feed owner_name)
+SOURCE_TABLES = ('owners', 'schemas', 'tables', 'columns')
+
+# One denormalized row per searchable entity, with its full parent context
+CATALOG_SEARCH_MV = """
+    CREATE MATERIALIZED VIEW catalog_search_mv AS
+    SELECT
+        'schema'::text AS result_type,
+        s.id AS entity_id,
+        s.name::text AS name,
+        s.description,
+        s.search_vector,
+        s.id AS schema_id,
+        s.name::text AS schema_name,
+        NULL::integer AS table_id,
+        NULL::text AS table_name,
+        NULL::integer AS column_id,
+        NULL::text AS column_name,
+        NULL::integer AS owner_id,
+        NULL::text AS owner_name
+    FROM schemas s
+
+    UNION ALL
+
+    SELECT
+        'table'::text,
+        t.id,
+        t.name::text,
+        t.description,
+        t.search_vector,
+        s.id,
+        s.name::text,
+        t.id,
+        t.name::text,
+        NULL::integer,
+        NULL::text,
+        t.owner_id,
+        o.name::text
+    FROM tables t
+    JOIN schemas s ON t.schema_id = s.id
+    LEFT JOIN owners o ON t.owner_id = o.id
+
+    UNION ALL
+
+    SELECT
+        'column'::text,
+        c.id,
+        c.name::text,
+        c.description,
+        c.search_vector,
+        s.id,
+        s.name::text,
+        t.id,
+        t.name::text,
+        c.id,
+        c.name::text,
+        t.owner_id,
+        o.name::text
+    FROM columns c
+    JOIN tables t ON c.table_id = t.id
+    JOIN schemas s ON t.schema_id = s.id
+    LEFT JOIN owners o ON t.owner_id = o.id;
+"""
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last row they received as the after_* cursor to fetch the next page.
+# Rank uses normalization 32 (rank / (rank + 1)) so it is bounded to [0, 1)
+# and comparable across schemas, tables and columns.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        result_type TEXT,
+        entity_id INTEGER,
+        name TEXT,
+        description TEXT,
+        name_highlight TEXT,
+        description_highlight TEXT,
+        rank REAL,
+        schema_id INTEGER,
+        schema_name TEXT,
+        table_id INTEGER,
+        table_name TEXT,
+        column_id INTEGER,
+        column_name TEXT,
+        owner_id INTEGER,
+        owner_name TEXT,
+        total_count BIGINT
+    ) AS $$
+    DECLARE
+        query tsquery := websearch_to_tsquery('english', search_terms);
+    BEGIN
+        RETURN QUERY
+        WITH
+        -- Single GIN probe over the denormalized view (schemas have no owner)
+        matches AS (
+            SELECT m.result_type AS kind, m.entity_id AS id, m.name, m.table_id,
+                ts_rank_cd(m.search_vector, query, 32) AS r
+            FROM catalog_search_mv m
+            WHERE m.search_vector @@ query
+              AND (filter_owner_id IS NULL OR m.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR m.schema_id = filter_schema_id)
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, m.table_id AS id, pt.name,
+                (MAX(m.r) * 0.9)::real AS r  -- Slightly lower rank than direct match
+            FROM matches m
+            JOIN catalog_search_mv pt ON pt.result_type = 'table' AND pt.entity_id = m.table_id
+            WHERE include_parent_tables
+              AND m.kind = 'column'
+              AND NOT EXISTS (
+                  SELECT 1 FROM matches d
+                  WHERE d.kind = 'table' AND d.id = m.table_id
+              )
+            GROUP BY m.table_id, pt.name
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM (
+                SELECT m.kind, m.id, m.name, m.r, FALSE AS is_parent FROM matches m
+                UNION ALL
+                SELECT pm.kind, pm.id, pm.name, pm.r, TRUE FROM par_matches pm
+            ) h
+            WHERE after_rank IS NULL OR h.r < after_rank
+               OR (h.r = after_rank AND (h.kind, h.name, h.id) > (after_type, after_name, after_id))
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Both CTEs are already materialized, so counting them is free
+        total AS (
+            SELECT (SELECT count(*) FROM matches) + (SELECT count(*) FROM par_matches) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT
+            p.kind AS result_type,
+            p.id AS entity_id,
+            p.name,
+            m.description,
+            CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                 ELSE ts_headline('english', p.name, query,
+                    'StartSel=<mark>, StopSel=</mark>')
+            END AS name_highlight,
+            CASE WHEN p.is_parent THEN COALESCE(m.description, '')
+                 ELSE ts_headline('english', COALESCE(m.description, ''), query,
+                    'StartSel=<mark>, StopSel=</mark>, MaxFragments=3, MaxWords=50')
+            END AS description_highlight,
+            p.r AS rank,
+            m.schema_id,
+            m.schema_name,
+            m.table_id,
+            m.table_name,
+            m.column_id,
+            m.column_name,
+            m.owner_id,
+            m.owner_name,
+            tot.total_count
+        FROM page p
+        CROSS JOIN total tot
+        JOIN catalog_search_mv m ON m.result_type = p.kind AND m.entity_id = p.id
+        ORDER BY p.r DESC, p.kind, p.name, p.id;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Serve search_catalog from a single GIN-indexed materialized view."""
+    op.execute(CATALOG_SEARCH_MV)
+
+    # The unique index is required for REFRESH ... CONCURRENTLY
+    op.create_index('idx_catalog_search_mv_entity', 'catalog_search_mv', ['result_type', 'entity_id'], unique=True)
+    op.create_index('idx_catalog_search_mv_search', 'catalog_search_mv', ['search_vector'], postgresql_using='gin')
+
+    # Keep the view current: refresh once per writing statement, without blocking readers
+    op.execute("""
+        CREATE OR REPLACE FUNCTION refresh_catalog_search_mv()
+        RETURNS trigger AS $$
+        BEGIN
+            REFRESH MATERIALIZED VIEW CONCURRENTLY catalog_search_mv;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for table in SOURCE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_catalog_search_mv_refresh
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION refresh_catalog_search_mv();
+        """)
+
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Point search_catalog back at the base tables and drop the view."""
+    previous = context.script.get_revision(down_revision).module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
+
+    for table in SOURCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_catalog_search_mv_refresh ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS refresh_catalog_search_mv();")
+
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS catalog_search_mv;")
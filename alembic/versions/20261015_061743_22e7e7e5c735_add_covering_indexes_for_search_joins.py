@@ -0,0 +1,42 @@
+"""add covering indexes for search joins
+
+Revision ID: 22e7e7e5c735
+Revises: a03afb4f1d23
+Create Date: 2026-10-15 06:17:43.549128
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '22e7e7e5c735'
+down_revision: Union[str, Sequence[str], None] = 'a03afb4f1d23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Cover the id lookups used when joining search hits to their parents, so
+    # names and foreign keys come from the index instead of the heap.
+    # Descriptions are left out: unbounded text can exceed the btree row size limit.
+    op.create_index('idx_schemas_cover', 'schemas', ['id'], postgresql_include=['name'])
+    op.create_index('idx_tables_cover', 'tables', ['id'], postgresql_include=['name', 'schema_id', 'owner_id'])
+    op.create_index('idx_columns_cover', 'columns', ['id'], postgresql_include=['name', 'table_id'])
+    op.create_index('idx_owners_cover', 'owners', ['id'], postgresql_include=['name'])
+
+    # Index-only scans need an up-to-date visibility map
+    with op.get_context().autocommit_block():
+        for table in ('schemas', 'tables', 'columns', 'owners'):
+            op.execute(f"VACUUM ANALYZE {table};")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_owners_cover', table_name='owners')
+    op.drop_index('idx_columns_cover', table_name='columns')
+    op.drop_index('idx_tables_cover', table_name='tables')
+    op.drop_index('idx_schemas_cover', table_name='schemas')
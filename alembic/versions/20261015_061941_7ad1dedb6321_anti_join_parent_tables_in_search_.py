@@ -0,0 +1,155 @@
+"""anti-join parent tables in search_catalog
+
+Revision ID: 7ad1dedb6321
+Revises: 22e7e7e5c735
+Create Date: 2026-10-15 06:19:41.928363
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7ad1dedb6321'
+down_revision: Union[str, Sequence[str], None] = '22e7e7e5c735'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last row they received as the after_* cursor to fetch the next page.
+# Rank uses normalization 32 (rank / (rank + 1)) so it is bounded to [0, 1)
+# and comparable across schemas, tables and columns.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        result_type TEXT,
+        entity_id INTEGER,
+        name TEXT,
+        description TEXT,
+        name_highlight TEXT,
+        description_highlight TEXT,
+        rank REAL,
+        schema_id INTEGER,
+        schema_name TEXT,
+        table_id INTEGER,
+        table_name TEXT,
+        column_id INTEGER,
+        column_name TEXT,
+        owner_id INTEGER,
+        owner_name TEXT,
+        total_count BIGINT
+    ) AS $$
+        WITH
+        -- Parse the search terms once
+        q AS (
+            SELECT websearch_to_tsquery('english', search_terms) AS query
+        ),
+
+        -- Single GIN probe over the denormalized view (schemas have no owner)
+        matches AS (
+            SELECT m.result_type AS kind, m.entity_id AS id, m.name, m.table_id,
+                ts_rank_cd(m.search_vector, q.query, 32) AS r
+            FROM catalog_search_mv m
+            CROSS JOIN q
+            WHERE m.search_vector @@ q.query
+              AND (filter_owner_id IS NULL OR m.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR m.schema_id = filter_schema_id)
+        ),
+
+        -- Best column rank per table, aggregated once before any join
+        col_parents AS (
+            SELECT m.table_id, MAX(m.r) AS r
+            FROM matches m
+            WHERE include_parent_tables
+              AND m.kind = 'column'
+            GROUP BY m.table_id
+        ),
+
+        table_hits AS (
+            SELECT m.id FROM matches m WHERE m.kind = 'table'
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, cp.table_id AS id, pt.name,
+                (cp.r * 0.9)::real AS r  -- Slightly lower rank than direct match
+            FROM col_parents cp
+            JOIN catalog_search_mv pt ON pt.result_type = 'table' AND pt.entity_id = cp.table_id
+            LEFT JOIN table_hits th ON th.id = cp.table_id
+            WHERE th.id IS NULL
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM (
+                SELECT m.kind, m.id, m.name, m.r, FALSE AS is_parent FROM matches m
+                UNION ALL
+                SELECT pm.kind, pm.id, pm.name, pm.r, TRUE FROM par_matches pm
+            ) h
+            WHERE after_rank IS NULL OR h.r < after_rank
+               OR (h.r = after_rank AND (h.kind, h.name, h.id) > (after_type, after_name, after_id))
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Both CTEs are already materialized, so counting them is free
+        total AS (
+            SELECT (SELECT count(*) FROM matches) + (SELECT count(*) FROM par_matches) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT
+            p.kind AS result_type,
+            p.id AS entity_id,
+            p.name,
+            m.description,
+            CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                 ELSE ts_headline('english', p.name, q.query,
+                    'StartSel=<mark>, StopSel=</mark>')
+            END AS name_highlight,
+            CASE WHEN p.is_parent THEN COALESCE(m.description, '')
+                 ELSE ts_headline('english', COALESCE(m.description, ''), q.query,
+                    'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=5, ShortWord=3')
+            END AS description_highlight,
+            p.r AS rank,
+            m.schema_id,
+            m.schema_name,
+            m.table_id,
+            m.table_name,
+            m.column_id,
+            m.column_name,
+            m.owner_id,
+            m.owner_name,
+            tot.total_count
+        FROM page p
+        CROSS JOIN total tot
+        CROSS JOIN q
+        JOIN catalog_search_mv m ON m.result_type = p.kind AND m.entity_id = p.id
+        ORDER BY p.r DESC, p.kind, p.name, p.id;
+    $$ LANGUAGE sql STABLE PARALLEL SAFE;
+"""
+
+
+def upgrade() -> None:
+    """Find parent tables with a grouped anti-join instead of a per-row NOT EXISTS."""
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Restore the previous version of the search function."""
+    # down_revision only adds indexes; a03afb4f1d23 holds the previous function
+    previous = context.script.get_revision('a03afb4f1d23').module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
@@ -0,0 +1,41 @@
+"""add brin indexes on created_at
+
+Revision ID: 247046d7b144
+Revises: 6088c81ee521
+Create Date: 2026-10-15 06:22:31.439539
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '247046d7b144'
+down_revision: Union[str, Sequence[str], None] = '6088c81ee521'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# created_at only grows with insertion order, so a block-range index gives
+# range pruning for recency filters at a tiny fraction of a btree's size.
+BRIN_INDEXES = {
+    'owners': 'idx_owners_created_brin',
+    'schemas': 'idx_schemas_created_brin',
+    'tables': 'idx_tables_created_brin',
+    'columns': 'idx_columns_created_brin',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, index in BRIN_INDEXES.items():
+        op.create_index(index, table, ['created_at'], postgresql_using='brin',
+                        postgresql_with={'pages_per_range': 32})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, index in BRIN_INDEXES.items():
+        op.drop_index(index, table_name=table)
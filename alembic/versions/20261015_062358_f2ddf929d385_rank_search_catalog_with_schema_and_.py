@@ -0,0 +1,230 @@
+"""rank search_catalog with schema and owner context weights
+
+Revision ID: f2ddf929d385
+Revises: 247046d7b144
+Create Date: 2026-10-15 06:23:58.766377
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2ddf929d385'
+down_revision: Union[str, Sequence[str], None] = '247046d7b144'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same rows as before plus a context_vector holding the inherited schema name
+# (weight C) and owner name (weight D). Matching still uses search_vector only;
+# the context only feeds ranking, so a hit on an entity's own name can be told
+# apart from one that shares a word with its schema or owner.
+CATALOG_SEARCH_MV = """
+    CREATE MATERIALIZED VIEW catalog_search_mv AS
+    SELECT
+        'schema'::text AS result_type,
+        s.id AS entity_id,
+        s.name::text AS name,
+        s.description,
+        s.search_vector,
+        ''::tsvector AS context_vector,
+        s.id AS schema_id,
+        s.name::text AS schema_name,
+        NULL::integer AS table_id,
+        NULL::text AS table_name,
+        NULL::integer AS column_id,
+        NULL::text AS column_name,
+        NULL::integer AS owner_id,
+        NULL::text AS owner_name
+    FROM schemas s
+
+    UNION ALL
+
+    SELECT
+        'table'::text,
+        t.id,
+        t.name::text,
+        t.description,
+        t.search_vector,
+        setweight(to_tsvector('english', coalesce(s.name, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(o.name, '')), 'D'),
+        s.id,
+        s.name::text,
+        t.id,
+        t.name::text,
+        NULL::integer,
+        NULL::text,
+        t.owner_id,
+        o.name::text
+    FROM tables t
+    JOIN schemas s ON t.schema_id = s.id
+    LEFT JOIN owners o ON t.owner_id = o.id
+
+    UNION ALL
+
+    SELECT
+        'column'::text,
+        c.id,
+        c.name::text,
+        c.description,
+        c.search_vector,
+        setweight(to_tsvector('english', coalesce(s.name, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(o.name, '')), 'D'),
+        s.id,
+        s.name::text,
+        t.id,
+        t.name::text,
+        c.id,
+        c.name::text,
+        t.owner_id,
+        o.name::text
+    FROM columns c
+    JOIN tables t ON c.table_id = t.id
+    JOIN schemas s ON t.schema_id = s.id
+    LEFT JOIN owners o ON t.owner_id = o.id;
+"""
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last row they received as the after_* cursor to fetch the next page.
+# Rank uses normalization 32 (rank / (rank + 1)) so it is bounded to [0, 1)
+# and comparable across schemas, tables and columns. Weights are {D, C, B, A}:
+# owner name, schema name, description, own name.
+# Each row is a single jsonb object keyed like the old 15 result columns, so
+# clients decode one value per row instead of 15 mostly-NULL columns.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        result JSONB,
+        total_count BIGINT
+    ) AS $$
+        WITH
+        -- Parse the search terms once
+        q AS (
+            SELECT websearch_to_tsquery('english', search_terms) AS query
+        ),
+
+        -- Single GIN probe over the denormalized view (schemas have no owner)
+        matches AS (
+            SELECT m.result_type AS kind, m.entity_id AS id, m.name, m.table_id,
+                ts_rank_cd('{0.1, 0.2, 0.5, 1.0}', m.search_vector || m.context_vector, q.query, 32) AS r
+            FROM catalog_search_mv m
+            CROSS JOIN q
+            WHERE m.search_vector @@ q.query
+              AND (filter_owner_id IS NULL OR m.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR m.schema_id = filter_schema_id)
+        ),
+
+        -- Best column rank per table, aggregated once before any join
+        col_parents AS (
+            SELECT m.table_id, MAX(m.r) AS r
+            FROM matches m
+            WHERE include_parent_tables
+              AND m.kind = 'column'
+            GROUP BY m.table_id
+        ),
+
+        table_hits AS (
+            SELECT m.id FROM matches m WHERE m.kind = 'table'
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, cp.table_id AS id, pt.name,
+                (cp.r * 0.9)::real AS r  -- Slightly lower rank than direct match
+            FROM col_parents cp
+            JOIN catalog_search_mv pt ON pt.result_type = 'table' AND pt.entity_id = cp.table_id
+            LEFT JOIN table_hits th ON th.id = cp.table_id
+            WHERE th.id IS NULL
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM (
+                SELECT m.kind, m.id, m.name, m.r, FALSE AS is_parent FROM matches m
+                UNION ALL
+                SELECT pm.kind, pm.id, pm.name, pm.r, TRUE FROM par_matches pm
+            ) h
+            WHERE after_rank IS NULL OR h.r < after_rank
+               OR (h.r = after_rank AND (h.kind, h.name, h.id) > (after_type, after_name, after_id))
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Both CTEs are already materialized, so counting them is free
+        total AS (
+            SELECT (SELECT count(*) FROM matches) + (SELECT count(*) FROM par_matches) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT
+            jsonb_build_object(
+                'result_type', p.kind,
+                'entity_id', p.id,
+                'name', p.name,
+                'description', m.description,
+                'name_highlight', CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                     ELSE ts_headline('english', p.name, q.query,
+                        'StartSel=<mark>, StopSel=</mark>')
+                END,
+                'description_highlight', CASE WHEN p.is_parent THEN COALESCE(m.description, '')
+                     ELSE ts_headline('english', COALESCE(m.description, ''), q.query,
+                        'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=5, ShortWord=3')
+                END,
+                'rank', p.r,
+                'schema_id', m.schema_id,
+                'schema_name', m.schema_name,
+                'table_id', m.table_id,
+                'table_name', m.table_name,
+                'column_id', m.column_id,
+                'column_name', m.column_name,
+                'owner_id', m.owner_id,
+                'owner_name', m.owner_name
+            ) AS result,
+            tot.total_count
+        FROM page p
+        CROSS JOIN total tot
+        CROSS JOIN q
+        JOIN catalog_search_mv m ON m.result_type = p.kind AND m.entity_id = p.id
+        ORDER BY p.r DESC, p.kind, p.name, p.id;
+    $$ LANGUAGE sql STABLE PARALLEL SAFE;
+"""
+
+
+def upgrade() -> None:
+    """Rank search_catalog matches with weighted schema and owner context."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS catalog_search_mv;")
+    op.execute(CATALOG_SEARCH_MV)
+
+    # The unique index is required for REFRESH ... CONCURRENTLY
+    op.create_index('idx_catalog_search_mv_entity', 'catalog_search_mv', ['result_type', 'entity_id'], unique=True)
+    op.create_index('idx_catalog_search_mv_search', 'catalog_search_mv', ['search_vector'], postgresql_using='gin')
+
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Restore the unweighted ranking and the view without context_vector."""
+    view = context.script.get_revision('ebf28b87c7e3').module
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS catalog_search_mv;")
+    op.execute(view.CATALOG_SEARCH_MV)
+
+    # The unique index is required for REFRESH ... CONCURRENTLY
+    op.create_index('idx_catalog_search_mv_entity', 'catalog_search_mv', ['result_type', 'entity_id'], unique=True)
+    op.create_index('idx_catalog_search_mv_search', 'catalog_search_mv', ['search_vector'], postgresql_using='gin')
+
+    # down_revision only adds indexes; 6088c81ee521 holds the previous function
+    previous = context.script.get_revision('6088c81ee521').module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
@@ -0,0 +1,42 @@
+"""disable gin fastupdate on search indexes
+
+Revision ID: 1d7869d56ae3
+Revises: f2ddf929d385
+Create Date: 2026-10-15 06:25:58.830119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d7869d56ae3'
+down_revision: Union[str, Sequence[str], None] = 'f2ddf929d385'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Searches far outnumber catalog writes, so write each GIN entry straight into
+# the index instead of a pending list that some unlucky search has to flush.
+SEARCH_INDEXES = (
+    'idx_schemas_search',
+    'idx_tables_search',
+    'idx_columns_search',
+    'idx_catalog_search_mv_search',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index in SEARCH_INDEXES:
+        op.execute(f"ALTER INDEX {index} SET (fastupdate = off);")
+        # Merge whatever is already pending so nothing is left for a search to flush
+        op.execute(f"SELECT gin_clean_pending_list('{index}'::regclass);")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index in SEARCH_INDEXES:
+        op.execute(f"ALTER INDEX {index} RESET (fastupdate);")
@@ -0,0 +1,40 @@
+"""index search filter columns
+
+Revision ID: eab5dd643a0e
+Revises: 039bf318bcb1
+Create Date: 2026-10-15 06:30:54.262268
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eab5dd643a0e'
+down_revision: Union[str, Sequence[str], None] = '039bf318bcb1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # owner_id / schema_id filters and parent joins; PostgreSQL does not index
+    # foreign key columns on its own
+    op.create_index('idx_tables_schema_id', 'tables', ['schema_id'])
+    op.create_index('idx_tables_owner_id', 'tables', ['owner_id'])
+    op.create_index('idx_columns_table_id', 'columns', ['table_id'])
+
+    # Same filters as applied by search_catalog on the view
+    op.create_index('idx_catalog_search_mv_owner', 'catalog_search_mv', ['owner_id'])
+    op.create_index('idx_catalog_search_mv_schema', 'catalog_search_mv', ['schema_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_catalog_search_mv_schema', table_name='catalog_search_mv')
+    op.drop_index('idx_catalog_search_mv_owner', table_name='catalog_search_mv')
+    op.drop_index('idx_columns_table_id', table_name='columns')
+    op.drop_index('idx_tables_owner_id', table_name='tables')
+    op.drop_index('idx_tables_schema_id', table_name='tables')
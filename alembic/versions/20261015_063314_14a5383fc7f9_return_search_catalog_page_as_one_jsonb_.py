@@ -0,0 +1,152 @@
+"""return search_catalog page as one jsonb document
+
+Revision ID: 14a5383fc7f9
+Revises: eab5dd643a0e
+Create Date: 2026-10-15 06:33:14.810041
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '14a5383fc7f9'
+down_revision: Union[str, Sequence[str], None] = 'eab5dd643a0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last result they received as the after_* cursor to fetch the next page.
+# Rank uses normalization 32 (rank / (rank + 1)) so it is bounded to [0, 1)
+# and comparable across schemas, tables and columns. Weights are {D, C, B, A}:
+# owner name, schema name, description, own name.
+# The whole page comes back as one row holding {"total_count": N, "results": [...]},
+# so clients decode a single value and still get the total for an empty page.
+# It stays a set-returning sql function so the planner can keep inlining it.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        response JSONB
+    ) AS $$
+        WITH
+        -- Parse the search terms once
+        q AS (
+            SELECT websearch_to_tsquery('english', search_terms) AS query
+        ),
+
+        -- Single GIN probe over the denormalized view (schemas have no owner)
+        matches AS (
+            SELECT m.result_type AS kind, m.entity_id AS id, m.name, m.table_id,
+                ts_rank_cd('{0.1, 0.2, 0.5, 1.0}', m.search_vector || m.context_vector, q.query, 32) AS r
+            FROM catalog_search_mv m
+            CROSS JOIN q
+            WHERE m.search_vector @@ q.query
+              AND (filter_owner_id IS NULL OR m.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR m.schema_id = filter_schema_id)
+        ),
+
+        -- Best column rank per table, aggregated once before any join
+        col_parents AS (
+            SELECT m.table_id, MAX(m.r) AS r
+            FROM matches m
+            WHERE include_parent_tables
+              AND m.kind = 'column'
+            GROUP BY m.table_id
+        ),
+
+        table_hits AS (
+            SELECT m.id FROM matches m WHERE m.kind = 'table'
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, cp.table_id AS id, pt.name,
+                (cp.r * 0.9)::real AS r  -- Slightly lower rank than direct match
+            FROM col_parents cp
+            JOIN catalog_search_mv pt ON pt.result_type = 'table' AND pt.entity_id = cp.table_id
+            LEFT JOIN table_hits th ON th.id = cp.table_id
+            WHERE th.id IS NULL
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM (
+                SELECT m.kind, m.id, m.name, m.r, FALSE AS is_parent FROM matches m
+                UNION ALL
+                SELECT pm.kind, pm.id, pm.name, pm.r, TRUE FROM par_matches pm
+            ) h
+            WHERE after_rank IS NULL OR h.r < after_rank
+               OR (h.r = after_rank AND (h.kind, h.name, h.id) > (after_type, after_name, after_id))
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Both CTEs are already materialized, so counting them is free
+        total AS (
+            SELECT (SELECT count(*) FROM matches) + (SELECT count(*) FROM par_matches) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT jsonb_build_object(
+            'total_count', (SELECT tot.total_count FROM total tot),
+            'results', COALESCE(jsonb_agg(r.result ORDER BY r.r DESC, r.kind, r.name, r.id), '[]'::jsonb)
+        ) AS response
+        FROM (
+            SELECT
+                jsonb_build_object(
+                    'result_type', p.kind,
+                    'entity_id', p.id,
+                    'name', p.name,
+                    'description', m.description,
+                    'name_highlight', CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                         ELSE ts_headline('english', p.name, q.query,
+                            'StartSel=<mark>, StopSel=</mark>')
+                    END,
+                    'description_highlight', CASE WHEN p.is_parent THEN COALESCE(m.description, '')
+                         ELSE ts_headline('english', substr(COALESCE(m.description, ''), 1, 8000), q.query,
+                            'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=5, ShortWord=3')
+                    END,
+                    'rank', p.r,
+                    'schema_id', m.schema_id,
+                    'schema_name', m.schema_name,
+                    'table_id', m.table_id,
+                    'table_name', m.table_name,
+                    'column_id', m.column_id,
+                    'column_name', m.column_name,
+                    'owner_id', m.owner_id,
+                    'owner_name', m.owner_name
+                ) AS result,
+                p.r, p.kind, p.name, p.id
+            FROM page p
+            CROSS JOIN q
+            JOIN catalog_search_mv m ON m.result_type = p.kind AND m.entity_id = p.id
+        ) r;
+    $$ LANGUAGE sql STABLE PARALLEL SAFE;
+"""
+
+
+def upgrade() -> None:
+    """Return the page and its total as a single jsonb document."""
+    op.execute("DROP FUNCTION IF EXISTS search_catalog(TEXT, INTEGER, INTEGER, BOOLEAN, INTEGER, REAL, TEXT, TEXT, INTEGER);")
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Restore the one-row-per-result version of the search function."""
+    op.execute("DROP FUNCTION IF EXISTS search_catalog(TEXT, INTEGER, INTEGER, BOOLEAN, INTEGER, REAL, TEXT, TEXT, INTEGER);")
+    # down_revision does not touch the function; 039bf318bcb1 holds the previous one
+    previous = context.script.get_revision('039bf318bcb1').module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
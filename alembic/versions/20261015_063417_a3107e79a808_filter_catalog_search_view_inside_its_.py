@@ -0,0 +1,46 @@
+"""filter catalog search view inside its GIN index
+
+Revision ID: a3107e79a808
+Revises: 14a5383fc7f9
+Create Date: 2026-10-15 06:34:17.889851
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3107e79a808'
+down_revision: Union[str, Sequence[str], None] = '14a5383fc7f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# btree_gin lets owner_id / schema_id live in the same GIN index as the
+# search_vector, so filtered searches drop non-matching owners and schemas
+# during the index scan instead of after fetching their view rows. It replaces
+# the plain search_vector index, so a view refresh still maintains one GIN
+# index; the extra btree keys only make each entry slightly larger.
+FILTERED_SEARCH_INDEX = """
+    CREATE INDEX idx_catalog_search_mv_search_filters ON catalog_search_mv
+    USING gin (search_vector, owner_id, schema_id) WITH (fastupdate = off);
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin;")
+    op.execute(FILTERED_SEARCH_INDEX)
+    op.drop_index('idx_catalog_search_mv_search', table_name='catalog_search_mv')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # btree_gin may predate this revision or be used elsewhere, so it stays
+    op.execute("""
+        CREATE INDEX idx_catalog_search_mv_search ON catalog_search_mv
+        USING gin (search_vector) WITH (fastupdate = off);
+    """)
+    op.drop_index('idx_catalog_search_mv_search_filters', table_name='catalog_search_mv')
@@ -0,0 +1,197 @@
+"""index names with the simple text search config
+
+Revision ID: 63e0ad71d4c0
+Revises: a3107e79a808
+Create Date: 2026-10-15 06:36:56.902831
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '63e0ad71d4c0'
+down_revision: Union[str, Sequence[str], None] = 'a3107e79a808'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCHABLE_TABLES = ('schemas', 'tables', 'columns')
+
+# Names are identifiers (dim_users, total_revenue), so they are indexed
+# verbatim with the 'simple' config as well as stemmed with 'english'. Rows are
+# still matched on the English parse only; the simple lexemes raise the rank
+# of exact identifier tokens. Descriptions are prose and stay English only.
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+"""
+
+# Results are ordered by (rank DESC, result_type, name, entity_id); callers pass
+# the last result they received as the after_* cursor to fetch the next page.
+# Rank uses normalization 32 (rank / (rank + 1)) so it is bounded to [0, 1)
+# and comparable across schemas, tables and columns. Weights are {D, C, B, A}:
+# owner name, schema name, description, own name.
+# Rows match the English parse only, so negated terms keep excluding rows;
+# ranking ORs in the simple parse so verbatim name tokens score higher.
+# The whole page comes back as one row holding {"total_count": N, "results": [...]},
+# so clients decode a single value and still get the total for an empty page.
+# It stays a set-returning sql function so the planner can keep inlining it.
+SEARCH_CATALOG_FUNCTION = """
+    CREATE OR REPLACE FUNCTION search_catalog(
+        search_terms TEXT,
+        filter_owner_id INTEGER DEFAULT NULL,
+        filter_schema_id INTEGER DEFAULT NULL,
+        include_parent_tables BOOLEAN DEFAULT TRUE,
+        page_size INTEGER DEFAULT 20,
+        after_rank REAL DEFAULT NULL,
+        after_type TEXT DEFAULT NULL,
+        after_name TEXT DEFAULT NULL,
+        after_id INTEGER DEFAULT NULL
+    )
+    RETURNS TABLE (
+        response JSONB
+    ) AS $$
+        WITH
+        -- Parse the search terms once
+        q AS (
+            SELECT websearch_to_tsquery('english', search_terms) AS query,
+                websearch_to_tsquery('english', search_terms) ||
+                websearch_to_tsquery('simple', search_terms) AS rank_query
+        ),
+
+        -- Single GIN probe over the denormalized view (schemas have no owner)
+        matches AS (
+            SELECT m.result_type AS kind, m.entity_id AS id, m.name, m.table_id,
+                ts_rank_cd('{0.1, 0.2, 0.5, 1.0}', m.search_vector || m.context_vector, q.rank_query, 32) AS r
+            FROM catalog_search_mv m
+            CROSS JOIN q
+            WHERE m.search_vector @@ q.query
+              AND (filter_owner_id IS NULL OR m.owner_id = filter_owner_id)
+              AND (filter_schema_id IS NULL OR m.schema_id = filter_schema_id)
+        ),
+
+        -- Best column rank per table, aggregated once before any join
+        col_parents AS (
+            SELECT m.table_id, MAX(m.r) AS r
+            FROM matches m
+            WHERE include_parent_tables
+              AND m.kind = 'column'
+            GROUP BY m.table_id
+        ),
+
+        table_hits AS (
+            SELECT m.id FROM matches m WHERE m.kind = 'table'
+        ),
+
+        -- Parent tables of matching columns that don't match directly
+        par_matches AS (
+            SELECT 'table'::text AS kind, cp.table_id AS id, pt.name,
+                (cp.r * 0.9)::real AS r  -- Slightly lower rank than direct match
+            FROM col_parents cp
+            JOIN catalog_search_mv pt ON pt.result_type = 'table' AND pt.entity_id = cp.table_id
+            LEFT JOIN table_hits th ON th.id = cp.table_id
+            WHERE th.id IS NULL
+        ),
+
+        page AS (
+            SELECT h.*
+            FROM (
+                SELECT m.kind, m.id, m.name, m.r, FALSE AS is_parent FROM matches m
+                UNION ALL
+                SELECT pm.kind, pm.id, pm.name, pm.r, TRUE FROM par_matches pm
+            ) h
+            WHERE after_rank IS NULL OR h.r < after_rank
+               OR (h.r = after_rank AND (h.kind, h.name, h.id) > (after_type, after_name, after_id))
+            ORDER BY h.r DESC, h.kind, h.name, h.id
+            LIMIT page_size
+        ),
+
+        -- Both CTEs are already materialized, so counting them is free
+        total AS (
+            SELECT (SELECT count(*) FROM matches) + (SELECT count(*) FROM par_matches) AS total_count
+        )
+
+        -- Fetch context and compute highlights for the surviving page only
+        SELECT jsonb_build_object(
+            'total_count', (SELECT tot.total_count FROM total tot),
+            'results', COALESCE(jsonb_agg(r.result ORDER BY r.r DESC, r.kind, r.name, r.id), '[]'::jsonb)
+        ) AS response
+        FROM (
+            SELECT
+                jsonb_build_object(
+                    'result_type', p.kind,
+                    'entity_id', p.id,
+                    'name', p.name,
+                    'description', m.description,
+                    'name_highlight', CASE WHEN p.is_parent THEN p.name  -- No highlight for parent
+                         ELSE ts_headline('english', p.name, q.query,
+                            'StartSel=<mark>, StopSel=</mark>')
+                    END,
+                    'description_highlight', CASE WHEN p.is_parent THEN COALESCE(m.description, '')
+                         ELSE ts_headline('english', substr(COALESCE(m.description, ''), 1, 8000), q.query,
+                            'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=5, ShortWord=3')
+                    END,
+                    'rank', p.r,
+                    'schema_id', m.schema_id,
+                    'schema_name', m.schema_name,
+                    'table_id', m.table_id,
+                    'table_name', m.table_name,
+                    'column_id', m.column_id,
+                    'column_name', m.column_name,
+                    'owner_id', m.owner_id,
+                    'owner_name', m.owner_name
+                ) AS result,
+                p.r, p.kind, p.name, p.id
+            FROM page p
+            CROSS JOIN q
+            JOIN catalog_search_mv m ON m.result_type = p.kind AND m.entity_id = p.id
+        ) r;
+    $$ LANGUAGE sql STABLE PARALLEL SAFE;
+"""
+
+
+def rebuild_search_vectors(expression) -> None:
+    """Regenerate search_vector from expression and rebuild the view that reads it."""
+    # The view depends on search_vector, so it has to go first
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS catalog_search_mv;")
+
+    # Dropping the generated column drops its GIN index too
+    for table in SEARCHABLE_TABLES:
+        op.execute(f"""
+            ALTER TABLE {table}
+                DROP COLUMN search_vector,
+                ADD COLUMN search_vector tsvector
+                    GENERATED ALWAYS AS ({expression}) STORED;
+        """)
+        op.create_index(f'idx_{table}_search', table, ['search_vector'], postgresql_using='gin',
+                        postgresql_with={'fastupdate': 'off'})
+
+    op.execute(context.script.get_revision('f2ddf929d385').module.CATALOG_SEARCH_MV)
+
+    # The unique index is required for REFRESH ... CONCURRENTLY
+    op.create_index('idx_catalog_search_mv_entity', 'catalog_search_mv', ['result_type', 'entity_id'], unique=True)
+
+    op.execute(context.script.get_revision('a3107e79a808').module.FILTERED_SEARCH_INDEX)
+
+    op.create_index('idx_catalog_search_mv_owner', 'catalog_search_mv', ['owner_id'])
+    op.create_index('idx_catalog_search_mv_schema', 'catalog_search_mv', ['schema_id'])
+
+
+def upgrade() -> None:
+    """Also index names verbatim with the simple config."""
+    rebuild_search_vectors(SEARCH_VECTOR_EXPRESSION)
+    op.execute(SEARCH_CATALOG_FUNCTION)
+
+
+def downgrade() -> None:
+    """Index names with the english config only."""
+    previous = context.script.get_revision('a8f597233941').module
+    rebuild_search_vectors(previous.SEARCH_VECTOR_EXPRESSION)
+
+    # down_revision does not touch the function; 14a5383fc7f9 holds the previous one
+    previous = context.script.get_revision('14a5383fc7f9').module
+    op.execute(previous.SEARCH_CATALOG_FUNCTION)
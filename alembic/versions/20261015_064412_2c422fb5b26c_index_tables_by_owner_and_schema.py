@@ -0,0 +1,32 @@
+"""index tables by owner and schema
+
+Revision ID: 2c422fb5b26c
+Revises: 63e0ad71d4c0
+Create Date: 2026-10-15 06:44:12.786233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c422fb5b26c'
+down_revision: Union[str, Sequence[str], None] = '63e0ad71d4c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the /schemas?owner_id= semi-join from the index alone; owner_id
+    # leads, so it also covers every lookup idx_tables_owner_id did
+    op.create_index('idx_tables_owner_schema', 'tables', ['owner_id', 'schema_id'])
+    op.drop_index('idx_tables_owner_id', table_name='tables')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_tables_owner_id', 'tables', ['owner_id'])
+    op.drop_index('idx_tables_owner_schema', table_name='tables')
@@ -0,0 +1,55 @@
+"""refresh catalog search view on demand instead of per statement
+
+Revision ID: d2c3ea7ae340
+Revises: 2c422fb5b26c
+Create Date: 2026-10-15 06:53:54.793174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c3ea7ae340'
+down_revision: Union[str, Sequence[str], None] = '2c422fb5b26c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SOURCE_TABLES = ('owners', 'schemas', 'tables', 'columns')
+
+# The statement-level triggers ran a full REFRESH ... CONCURRENTLY inside every
+# writer's transaction, and concurrent refreshes of one view serialize, so each
+# write paid for a whole rebuild and writers queued behind each other. The view
+# is now refreshed by the API every MV_REFRESH_SECONDS, by POST /admin/refresh
+# and by bulk_mode.
+REFRESH_FUNCTION = """
+    CREATE OR REPLACE FUNCTION refresh_catalog_search_mv()
+    RETURNS trigger AS $$
+    BEGIN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY catalog_search_mv;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Stop refreshing catalog_search_mv on every catalog write."""
+    for table in SOURCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_catalog_search_mv_refresh ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS refresh_catalog_search_mv();")
+
+
+def downgrade() -> None:
+    """Refresh catalog_search_mv once per writing statement again."""
+    op.execute(REFRESH_FUNCTION)
+
+    for table in SOURCE_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_catalog_search_mv_refresh
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION refresh_catalog_search_mv();
+        """)
@@ -0,0 +1,36 @@
+"""
+Bulk ingest helpers for loading large batches into the catalog tables
+"""
+
+from contextlib import contextmanager
+from sqlalchemy import text
+
+# GIN indexes maintained row by row on every insert
+SEARCH_INDEXES = {
+    'schemas': 'idx_schemas_search',
+    'tables': 'idx_tables_search',
+    'columns': 'idx_columns_search',
+}
+
+@contextmanager
+def bulk_mode(engine):
+    """
+    Defer search index maintenance while loading catalog data.
+
+    On enter, drops the GIN search indexes. On exit, rebuilds them in one pass
+    and refreshes catalog_search_mv once. Searches run without the indexes and
+    against a stale view until the block exits, so use it for offline loads.
+    """
+    with engine.begin() as conn:
+        for index in SEARCH_INDEXES.values():
+            conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+    try:
+        yield
+    finally:
+        with engine.begin() as conn:
+            for table, index in SEARCH_INDEXES.items():
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index} ON {table} USING gin (search_vector) WITH (fastupdate = off)"
+                ))
+            conn.execute(text("REFRESH MATERIALIZED VIEW catalog_search_mv"))
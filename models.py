@@ -1,10 +1,22 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func, Index, Computed
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import TSVECTOR
 
 Base = declarative_base()
 
+# search_vector is a generated column: name is weighted A, description B.
+# It is stored rather than left to an expression index because ranking and
+# GIN rechecks read it for every match; recomputing to_tsvector at query time
+# would cost more than the write it saves on this read-heavy catalog.
+# Names also carry their verbatim 'simple' lexemes, which only raise the rank
+# of exact identifier hits; rows are matched on the English lexemes alone.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
 
 class Owner(Base):
     __tablename__ = 'owners'
@@ -15,6 +27,12 @@ class Owner(Base):
     created_at = Column(DateTime, server_default=func.now())
     
     tables = relationship("Table", back_populates="owner")
+    
+    __table_args__ = (
+        Index('idx_owners_cover', 'id', postgresql_include=['name']),
+        Index('idx_owners_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+    )
 
 
 class Schema(Base):
@@ -24,12 +42,16 @@ class Schema(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text)
     created_at = Column(DateTime, server_default=func.now())
-    search_vector = Column(TSVECTOR)
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
     
     tables = relationship("Table", back_populates="schema")
     
     __table_args__ = (
-        Index('idx_schemas_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_schemas_search', 'search_vector', postgresql_using='gin',
+              postgresql_with={'fastupdate': 'off'}),
+        Index('idx_schemas_cover', 'id', postgresql_include=['name']),
+        Index('idx_schemas_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -42,14 +64,20 @@ class Table(Base):
     schema_id = Column(Integer, ForeignKey('schemas.id'), nullable=False)
     owner_id = Column(Integer, ForeignKey('owners.id'), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
-    search_vector = Column(TSVECTOR)
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
     
     schema = relationship("Schema", back_populates="tables")
     owner = relationship("Owner", back_populates="tables")
     columns = relationship("Column", back_populates="table")
     
     __table_args__ = (
-        Index('idx_tables_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_tables_search', 'search_vector', postgresql_using='gin',
+              postgresql_with={'fastupdate': 'off'}),
+        Index('idx_tables_cover', 'id', postgresql_include=['name', 'schema_id', 'owner_id']),
+        Index('idx_tables_schema_id', 'schema_id'),
+        Index('idx_tables_owner_schema', 'owner_id', 'schema_id'),
+        Index('idx_tables_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -61,10 +89,15 @@ class Column(Base):
     description = Column(Text)
     table_id = Column(Integer, ForeignKey('tables.id'), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
-    search_vector = Column(TSVECTOR)
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
     
     table = relationship("Table", back_populates="columns")
     
     __table_args__ = (
-        Index('idx_columns_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_columns_search', 'search_vector', postgresql_using='gin',
+              postgresql_with={'fastupdate': 'off'}),
+        Index('idx_columns_cover', 'id', postgresql_include=['name', 'table_id']),
+        Index('idx_columns_table_id', 'table_id'),
+        Index('idx_columns_created_brin', 'created_at', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
     )
\ No newline at end of file
@@ -1,17 +1,22 @@
+import csv
+import io
 import os
 import random
 from faker import Faker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from dotenv import load_dotenv
 from models import Owner, Schema, Table, Column, Base
+from bulk_ingest import bulk_mode
 
 load_dotenv()
 
 fake = Faker()
 
 DATABASE_URL = os.getenv('DATABASE_URL')
-engine = create_engine(DATABASE_URL)
+# One-shot script: no point keeping idle connections around
+engine = create_engine(DATABASE_URL, poolclass=NullPool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Data generation helpers
@@ -35,18 +40,47 @@ COLUMN_TYPES = [
     'rating', 'comment', 'notes', 'metadata', 'configuration', 'settings'
 ]
 
+# Faker providers are slow per call, so names and descriptions are sampled
+# from pools generated up front
+WORD_POOL_SIZE = 512
+TEXT_POOL_SIZE = 256
+
+def insert_rows(session, model, rows):
+    """Insert rows in batched multi-row INSERTs and return their ids in input order."""
+    if not rows:
+        return []
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(session.scalars(statement, rows))
+
+def copy_rows(session, model, rows):
+    """Stream rows into the model's table with COPY and return how many were loaded."""
+    if not rows:
+        return 0
+    fields = list(rows[0])
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fields)
+    writer.writerows(rows)
+    buf.seek(0)
+    
+    # Runs on the session's connection, so it shares the load's transaction
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {model.__tablename__} ({', '.join(fields)}) FROM STDIN WITH (FORMAT csv)", buf
+        )
+    finally:
+        cursor.close()
+    return len(rows)
+
 def generate_owners(session, count=5):
     """Generate random owners with realistic data."""
     owners = []
     for _ in range(count):
-        owner = Owner(
-            name=fake.name(),
-            email=fake.unique.email()
-        )
-        owners.append(owner)
-        session.add(owner)
-    session.commit()
-    return owners
+        owners.append({
+            'name': fake.name(),
+            'email': fake.unique.email()
+        })
+    return insert_rows(session, Owner, owners)
 
 def generate_schemas(session, count=10):
     """Generate random schemas with meaningful names and descriptions."""
@@ -55,45 +89,44 @@ def generate_schemas(session, count=10):
         schema_name = random.choice(SCHEMA_TYPES) + f"_{fake.word()}"
         schema_desc = fake.text(max_nb_chars=200)
         
-        schema = Schema(
-            name=schema_name,
-            description=schema_desc
-        )
-        schemas.append(schema)
-        session.add(schema)
-    session.commit()
-    return schemas
+        schemas.append({
+            'name': schema_name,
+            'description': schema_desc
+        })
+    return insert_rows(session, Schema, schemas)
 
-def generate_tables(session, schemas, owners, count=100):
+def generate_tables(session, schema_ids, owner_ids, count=100):
     """Generate random tables with realistic names and optional owners."""
     tables = []
+    word_pool = fake.words(nb=WORD_POOL_SIZE)
+    desc_pool = fake.texts(nb_texts=TEXT_POOL_SIZE, max_nb_chars=150)
+    owner_pool = owner_ids + [None] * 3  # 75% chance of having an owner
     for _ in range(count):
         table_category = random.choice(TABLE_CATEGORIES)
-        table_suffix = fake.word() if random.choice([True, False]) else ""
+        table_suffix = random.choice(word_pool) if random.random() < 0.5 else ""
         table_name = f"{table_category}_{table_suffix}" if table_suffix else table_category
         
-        table_desc = fake.text(max_nb_chars=150)
-        schema = random.choice(schemas)
-        owner = random.choice(owners + [None] * 3)  # 75% chance of having an owner
+        table_desc = random.choice(desc_pool)
+        schema_id = random.choice(schema_ids)
+        owner_id = random.choice(owner_pool)
         
-        table = Table(
-            name=table_name,
-            description=table_desc,
-            schema_id=schema.id,
-            owner_id=owner.id if owner else None
-        )
-        tables.append(table)
-        session.add(table)
-    session.commit()
-    return tables
+        tables.append({
+            'name': table_name,
+            'description': table_desc,
+            'schema_id': schema_id,
+            'owner_id': owner_id
+        })
+    return insert_rows(session, Table, tables)
 
-def generate_columns(session, tables, count=1000):
+def generate_columns(session, table_ids, count=1000):
     """Generate random columns with meaningful names for each table."""
     columns = []
-    tables_per_column_batch = count // len(tables)
-    remaining_columns = count % len(tables)
+    word_pool = fake.words(nb=WORD_POOL_SIZE)
+    desc_pool = fake.texts(nb_texts=TEXT_POOL_SIZE, max_nb_chars=100)
+    tables_per_column_batch = count // len(table_ids)
+    remaining_columns = count % len(table_ids)
     
-    for i, table in enumerate(tables):
+    for i, table_id in enumerate(table_ids):
         # Calculate how many columns this table should have
         columns_for_table = tables_per_column_batch
         if i < remaining_columns:
@@ -109,7 +142,7 @@ def generate_columns(session, tables, count=1000):
             attempts = 0
             while attempts < 50:  # Prevent infinite loop
                 base_name = random.choice(COLUMN_TYPES)
-                column_name = f"{base_name}_{fake.word()}" if random.choice([True, False]) else base_name
+                column_name = f"{base_name}_{random.choice(word_pool)}" if random.random() < 0.5 else base_name
                 
                 if column_name not in used_column_names:
                     used_column_names.add(column_name)
@@ -120,55 +153,57 @@ def generate_columns(session, tables, count=1000):
                 column_name = f"column_{len(used_column_names) + 1}"
                 used_column_names.add(column_name)
             
-            column_desc = fake.text(max_nb_chars=100)
+            column_desc = random.choice(desc_pool)
             
-            column = Column(
-                name=column_name,
-                description=column_desc,
-                table_id=table.id
-            )
-            columns.append(column)
-            session.add(column)
+            columns.append({
+                'name': column_name,
+                'description': column_desc,
+                'table_id': table_id
+            })
     
-    session.commit()
-    return columns
+    # Columns are the bulk of any seed and nothing needs their ids back
+    return copy_rows(session, Column, columns)
 
 def seed_database():
     """Main function to seed the database with test data."""
-    session = SessionLocal()
-    try:
-        # Clear existing data (optional - remove if you want to append)
-        print("Clearing existing data...")
-        session.query(Column).delete()
-        session.query(Table).delete()
-        session.query(Schema).delete()
-        session.query(Owner).delete()
-        session.commit()
+    # Defer GIN index and catalog_search_mv maintenance until the load is done
+    with bulk_mode(engine):
+        session = SessionLocal()
+        try:
+            # Clear existing data (optional - remove if you want to append)
+            print("Clearing existing data...")
+            session.query(Column).delete()
+            session.query(Table).delete()
+            session.query(Schema).delete()
+            session.query(Owner).delete()
         
-        print("Generating 5 owners...")
-        owners = generate_owners(session, 5)
+            print("Generating 5 owners...")
+            owners = generate_owners(session, 5)
         
-        print("Generating 10 schemas...")
-        schemas = generate_schemas(session, 10)
+            print("Generating 10 schemas...")
+            schemas = generate_schemas(session, 10)
         
-        print("Generating 100 tables...")
-        tables = generate_tables(session, schemas, owners, 100)
+            print("Generating 100 tables...")
+            tables = generate_tables(session, schemas, owners, 100)
         
-        print("Generating 1000 columns...")
-        columns = generate_columns(session, tables, 1000)
+            print("Generating 1000 columns...")
+            column_count = generate_columns(session, tables, 1000)
         
-        print(f"\n✅ Database seeded successfully!")
-        print(f"   - {len(owners)} owners created")
-        print(f"   - {len(schemas)} schemas created")
-        print(f"   - {len(tables)} tables created")
-        print(f"   - {len(columns)} columns created")
+            # One transaction for the whole load
+            session.commit()
         
-    except Exception as e:
-        session.rollback()
-        print(f"❌ Error seeding database: {e}")
-        raise
-    finally:
-        session.close()
+            print(f"\n✅ Database seeded successfully!")
+            print(f"   - {len(owners)} owners created")
+            print(f"   - {len(schemas)} schemas created")
+            print(f"   - {len(tables)} tables created")
+            print(f"   - {column_count} columns created")
+        
+        except Exception as e:
+            session.rollback()
+            print(f"❌ Error seeding database: {e}")
+            raise
+        finally:
+            session.close()
 
 if __name__ == "__main__":
     seed_database()
\ No newline at end of file